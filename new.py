@@ -1,14 +1,397 @@
-from web3 import Web3
+from web3 import AsyncWeb3
+from web3.datastructures import AttributeDict
 from web3.exceptions import TransactionNotFound
+from eth_abi import encode, decode
 from eth_account import Account
-from aiohttp import ClientSession, ClientTimeout, ClientResponseError
-from aiohttp_socks import ProxyConnector
+from eth_keys.backends import get_backend
+from aiohttp import ClientSession, ClientTimeout, ClientError, ClientConnectorError, ClientPayloadError, ClientResponseError, TCPConnector, TraceConfig
+from aiohttp_socks import ProxyConnector, ProxyConnectionError, ProxyError, ProxyTimeoutError
 from fake_useragent import FakeUserAgent
 from datetime import datetime
+from contextvars import ContextVar
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict, deque
 from colorama import *
 import asyncio, random, json, time, os, pytz
 
 wib = pytz.timezone('Asia/Jakarta')
+log_account = ContextVar("log_account", default=None)
+call_max_age = ContextVar("call_max_age", default=0)
+worker_accounts = {}
+
+def derive_address(private_key: str):
+    try:
+        return Account.from_key(private_key).address
+    except Exception:
+        return None
+
+def sign_with_key(private_key: str, tx: dict):
+    if private_key not in worker_accounts:
+        worker_accounts[private_key] = Account.from_key(private_key)
+    return bytes(worker_accounts[private_key].sign_transaction(tx).raw_transaction)
+
+class RateLimiter:
+    def __init__(self, rate: float, min_rate=1.0, burst=None):
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.tokens = self.capacity()
+        self.updated = time.monotonic()
+        self.paused_until = 0
+        self.recent = deque()
+        self.stats = {"acquired": 0, "throttled": 0, "waited": 0.0}
+
+    def capacity(self):
+        if self.burst:
+            return max(min(self.burst, self.rate), 1)
+        return max(self.rate / 10, 1)
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity(), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens=1):
+        tokens = min(tokens, self.capacity())
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            self.refill(now)
+            if now >= self.paused_until and self.tokens >= tokens:
+                self.tokens -= tokens
+                break
+            await asyncio.sleep(max(self.paused_until - now, (tokens - self.tokens) / self.rate, 0.001))
+
+        self.stats["acquired"] += tokens
+        self.stats["waited"] += now - started
+        self.recent.append((now, tokens))
+
+    def throttle(self, retry_after=None):
+        now = time.monotonic()
+        self.refill(now)
+        if now >= self.paused_until:
+            self.rate = max(self.rate * 0.5, self.min_rate)
+        self.tokens = 0
+        self.paused_until = max(self.paused_until, now + (retry_after if retry_after is not None else 1 / self.rate))
+        self.stats["throttled"] += 1
+
+    def recover(self, tokens=1):
+        if self.rate < self.max_rate:
+            self.rate = min(self.rate + tokens / self.rate, self.max_rate)
+
+    def utilisation(self):
+        now = time.monotonic()
+        while self.recent and now - self.recent[0][0] > 1:
+            self.recent.popleft()
+        return sum(tokens for _, tokens in self.recent) / self.rate
+
+def parse_retry_after(error: Exception):
+    headers = getattr(error, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+class BatchingHTTPProvider(AsyncWeb3.AsyncHTTPProvider):
+    def __init__(self, endpoint_uris: list, batch_window=0.0, max_batch_size=50, broadcast_window=0.0, max_broadcast_size=100, call_cache_size=4096, quarantine_time=10, hedge_budget=0.0, read_rate=200, write_rate=50, rate_limiters=None, **kwargs) -> None:
+        super().__init__(endpoint_uris[0], **kwargs)
+        self.endpoint_uris = endpoint_uris
+        self.endpoint_stats = {
+            uri: {"latency": None, "failures": 0, "quarantined_until": 0, "samples": deque(maxlen=200)} for uri in endpoint_uris
+        }
+        self.quarantine_time = quarantine_time
+        self.rate_limiters = rate_limiters if rate_limiters is not None else {
+            (uri, kind): RateLimiter(
+                read_rate if kind == "call" else write_rate,
+                burst=max_batch_size if kind == "call" else max_broadcast_size
+            )
+            for uri in endpoint_uris for kind in ["call", "broadcast"]
+        }
+        self.hedge_budget = hedge_budget
+        self.read_latencies = deque(maxlen=1000)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.broadcast_window = broadcast_window
+        self.max_broadcast_size = max_broadcast_size
+        self.batch_queues = {"call": [], "nonce": [], "broadcast": []}
+        self.batch_flushes = {}
+        self.inflight_requests = {}
+        self.call_cache = OrderedDict()
+        self.call_cache_size = call_cache_size
+        self.head_block = None
+        self.chain_id_response = None
+        self.batch_stats = {"calls": 0, "requests": 0, "broadcasts": 0, "coalesced": 0, "cached": 0, "hedged": 0, "hedge_wins": 0}
+
+    def call_cache_key(self, method, params):
+        if method != "eth_call" or len(params) > 2 or not isinstance(params[0], dict):
+            return None
+
+        tag = params[1] if len(params) > 1 else "latest"
+        if isinstance(tag, str) and tag.startswith("0x"):
+            block_number, is_latest = int(tag, 16), False
+        elif tag == "latest" and self.head_block is not None:
+            block_number, is_latest = self.head_block, True
+        else:
+            return None
+
+        tx = params[0]
+        return (block_number, is_latest, str(tx.get("to", "")).lower(), str(tx.get("from", "")).lower(), str(tx.get("data") or tx.get("input") or ""))
+
+    def get_cached_call(self, key):
+        entry = self.call_cache.get(key)
+        if entry is None:
+            return None
+
+        fetched_at, response = entry
+        if key[1] and (time.time() - fetched_at) * 1000 > call_max_age.get():
+            return None
+
+        self.call_cache.move_to_end(key)
+        return response
+
+    def store_call(self, key, response):
+        self.call_cache[key] = (time.time(), response)
+        self.call_cache.move_to_end(key)
+        while len(self.call_cache) > self.call_cache_size:
+            self.call_cache.popitem(last=False)
+
+    def observe_head(self, block_number: int):
+        if self.head_block is not None and block_number <= self.head_block:
+            return
+
+        self.head_block = block_number
+        for key in [key for key in self.call_cache if key[1] and key[0] < block_number]:
+            del self.call_cache[key]
+
+    async def make_request(self, method, params):
+        if method in ("eth_sendRawTransaction", "eth_sendTransaction"):
+            return await self.enqueue_request(method, params)
+
+        if method == "eth_chainId" and self.chain_id_response:
+            self.batch_stats["cached"] += 1
+            return self.chain_id_response
+
+        cache_key = self.call_cache_key(method, params)
+        if cache_key:
+            cached = self.get_cached_call(cache_key)
+            if cached is not None:
+                self.batch_stats["cached"] += 1
+                return cached
+
+        key = (method, json.dumps(params, sort_keys=True, default=repr))
+        future = self.inflight_requests.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.enqueue_request(method, params))
+            self.inflight_requests[key] = future
+            future.add_done_callback(lambda _: self.inflight_requests.pop(key, None))
+        else:
+            self.batch_stats["coalesced"] += 1
+
+        response = await asyncio.shield(future)
+        if method == "eth_blockNumber" and isinstance(response.get("result"), str):
+            self.observe_head(int(response["result"], 16))
+        elif method == "eth_chainId" and "result" in response:
+            self.chain_id_response = response
+        elif cache_key and "result" in response:
+            self.store_call(cache_key, response)
+
+        return response
+
+    async def enqueue_request(self, method, params):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        kind = self.request_kind(method, params)
+        queue = self.batch_queues[kind]
+        queue.append((method, params, future))
+
+        max_size = self.max_broadcast_size if kind == "broadcast" else self.max_batch_size
+        if len(queue) >= max_size:
+            self.flush_batch(kind)
+        elif kind not in self.batch_flushes:
+            window = self.broadcast_window if kind == "broadcast" else self.batch_window
+            self.batch_flushes[kind] = loop.call_later(window, self.flush_batch, kind)
+
+        return await future
+
+    def request_kind(self, method, params):
+        if method == "eth_sendRawTransaction":
+            return "broadcast"
+        if method == "eth_getTransactionCount" and len(params) > 1 and params[1] == "pending":
+            return "nonce"
+        return "call"
+
+    def flush_batch(self, kind="call"):
+        handle = self.batch_flushes.pop(kind, None)
+        if handle:
+            handle.cancel()
+
+        queue = self.batch_queues[kind]
+        max_size = self.max_broadcast_size if kind == "broadcast" else self.max_batch_size
+        while queue:
+            batch = queue[:max_size]
+            del queue[:max_size]
+            asyncio.create_task(self.send_batch(kind, batch))
+
+    async def cache_endpoint_session(self, endpoint_uri: str, session: ClientSession):
+        return await self._request_session_manager.async_cache_and_return_session(endpoint_uri, session)
+
+    def choose_endpoint(self, kind: str, tried: set):
+        now = time.time()
+        candidates = [uri for uri in self.endpoint_uris if uri not in tried]
+        for uri in candidates:
+            stats = self.endpoint_stats[uri]
+            if stats["quarantined_until"] and stats["quarantined_until"] <= now:
+                stats["quarantined_until"] = 0
+                stats["latency"] = None
+
+        healthy = [uri for uri in candidates if not self.endpoint_stats[uri]["quarantined_until"]]
+        if not healthy:
+            return min(candidates, key=lambda uri: self.endpoint_stats[uri]["quarantined_until"])
+        if kind in ("broadcast", "nonce"):
+            return healthy[0]
+
+        return min(healthy, key=lambda uri: self.endpoint_stats[uri]["latency"] or 0)
+
+    def record_endpoint(self, endpoint_uri: str, latency=None):
+        stats = self.endpoint_stats[endpoint_uri]
+        if latency is None:
+            stats["failures"] += 1
+            stats["quarantined_until"] = time.time() + self.quarantine_time * 2 ** min(stats["failures"] - 1, 5)
+            return
+
+        stats["latency"] = latency if stats["latency"] is None else stats["latency"] * 0.8 + latency * 0.2
+        stats["failures"] = 0
+        stats["samples"].append(latency)
+
+    def hedge_delay(self, endpoint_uri: str):
+        samples = self.endpoint_stats[endpoint_uri]["samples"]
+        if len(samples) < 20:
+            return None
+        return sorted(samples)[int(len(samples) * 0.9)]
+
+    def hedge_endpoint(self, tried: set):
+        if self.batch_stats["hedged"] >= self.hedge_budget * self.batch_stats["requests"]:
+            return None
+
+        healthy = [
+            uri for uri in self.endpoint_uris
+            if uri not in tried and not self.endpoint_stats[uri]["quarantined_until"]
+        ]
+        return min(healthy, key=lambda uri: self.endpoint_stats[uri]["latency"] or 0) if healthy else None
+
+    async def post_batch(self, endpoint_uri: str, batch: list):
+        requests = [self.form_request(method, params) for method, params, _ in batch]
+        if len(batch) == 1:
+            request_data = self.encode_rpc_dict(requests[0])
+        else:
+            request_data = b"[" + b", ".join(self.encode_rpc_dict(request) for request in requests) + b"]"
+
+        raw_response = await self._request_session_manager.async_make_post_request(
+            endpoint_uri, request_data, **self.get_request_kwargs()
+        )
+        response = self.decode_rpc_response(raw_response)
+
+        if len(batch) == 1:
+            return [response]
+        if not isinstance(response, list):
+            return [response] * len(batch)
+
+        responses = {item.get("id"): item for item in response if isinstance(item, dict)}
+        return [responses.get(request["id"]) for request in requests]
+
+    async def timed_post(self, endpoint_uri: str, batch: list, kind="call"):
+        limiter = self.rate_limiters[(endpoint_uri, "broadcast" if kind == "broadcast" else "call")]
+        for attempt in range(3):
+            await limiter.acquire(len(batch))
+            started = time.time()
+            try:
+                responses = await self.post_batch(endpoint_uri, batch)
+            except ClientResponseError as e:
+                if e.status == 429:
+                    limiter.throttle(parse_retry_after(e))
+                    if attempt < 2:
+                        continue
+                    raise
+                self.record_endpoint(endpoint_uri)
+                raise
+            except Exception:
+                self.record_endpoint(endpoint_uri)
+                raise
+
+            limiter.recover(len(batch))
+            self.record_endpoint(endpoint_uri, time.time() - started)
+            return responses
+
+    async def hedged_post(self, endpoint_uri: str, batch: list, tried: set):
+        primary = asyncio.ensure_future(self.timed_post(endpoint_uri, batch))
+        delay = self.hedge_delay(endpoint_uri)
+        if delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        hedge_uri = None if done else self.hedge_endpoint(tried)
+        if hedge_uri is None:
+            return await primary
+
+        tried.add(hedge_uri)
+        self.batch_stats["hedged"] += 1
+        hedge = asyncio.ensure_future(self.timed_post(hedge_uri, batch))
+
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if task is hedge:
+                        self.batch_stats["hedge_wins"] += 1
+                    return task.result()
+
+        return primary.result()
+
+    def never_delivered(self, error: Exception):
+        if isinstance(error, ClientConnectorError):
+            return True
+        return isinstance(error, ClientResponseError) and error.status == 429
+
+    async def send_batch(self, kind: str, batch: list):
+        self.batch_stats["calls"] += len(batch)
+        self.batch_stats["requests"] += 1
+        if kind == "broadcast":
+            self.batch_stats["broadcasts"] += len(batch)
+
+        tried = set()
+        started = time.time()
+        while True:
+            endpoint_uri = self.choose_endpoint(kind, tried)
+            tried.add(endpoint_uri)
+            try:
+                if kind == "call" and self.hedge_budget:
+                    responses = await self.hedged_post(endpoint_uri, batch, tried)
+                else:
+                    responses = await self.timed_post(endpoint_uri, batch, kind)
+                break
+            except Exception as e:
+                if len(tried) < len(self.endpoint_uris) and (kind != "broadcast" or self.never_delivered(e)):
+                    continue
+
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        if kind == "call":
+            self.read_latencies.append(time.time() - started)
+
+        for (method, _, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if response is None:
+                future.set_exception(ClientPayloadError(f"No Response For {method} In Batch Reply"))
+            else:
+                future.set_result(response)
 
 class Faroswap:
     def __init__(self) -> None:
@@ -23,6 +406,7 @@ class Faroswap:
             "User-Agent": FakeUserAgent().random
         }
         self.RPC_URL = "https://api.zan.top/node/v1/pharos/testnet/54b49326c9f44b6e8730dc5dd4348421"
+        self.RPC_URLS = [self.RPC_URL, "https://testnet.dplabs-internal.com"]
         self.PHRS_CONTRACT_ADDRESS = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
         self.WPHRS_CONTRACT_ADDRESS = "0x3019B247381c850ab53Dc0EE53bCe7A07Ea9155f"
         self.USDC_CONTRACT_ADDRESS = "0x72df0bcd7276f2dFbAc900D1CE63c272C4BCcCED"
@@ -32,6 +416,99 @@ class Faroswap:
         self.MIXSWAP_ROUTER_ADDRESS = "0x3541423f25A1Ca5C98fdBCf478405d3f0aaD1164"
         self.DVM_ROUTER_ADDRESS = "0x4b177AdEd3b8bD1D5D747F91B9E853513838Cd49"
         self.POOL_ROUTER_ADDRESS = "0x73cafc894dbfc181398264934f7be4e482fc9d40"
+        self.MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+        self.MULTICALL_BATCH_SIZE = 500
+        self.READ_SELECTORS = {
+            "balanceOf": bytes.fromhex("70a08231"),
+            "decimals": bytes.fromhex("313ce567"),
+            "allowance": bytes.fromhex("dd62ed3e"),
+            "getEthBalance": bytes.fromhex("4d2301cc"),
+            "aggregate3": bytes.fromhex("82ad56cb"),
+            "querySellBase": bytes.fromhex("79a04876"),
+            "querySellQuote": bytes.fromhex("66410a21")
+        }
+        self.WRITE_SELECTORS = {
+            "deposit": bytes.fromhex("d0e30db0"),
+            "withdraw": bytes.fromhex("2e1a7d4d"),
+            "approve": bytes.fromhex("095ea7b3"),
+            "addDVMLiquidity": bytes.fromhex("674d9422"),
+            "dodoSwapV2TokenToToken": bytes.fromhex("f87dc1b7")
+        }
+        self.ROUTE_CACHE_TTL = 15
+        self.ROUTE_CACHE_BLOCKS = 5
+        self.HTTP_POOL_SIZE = 100
+        self.HTTP_DNS_CACHE_TTL = 300
+        self.HTTP_KEEPALIVE_TIMEOUT = 60
+        self.FEE_STRATEGY = "normal"
+        self.FEE_PERCENTILES = {"cheap": 10, "normal": 50, "fast": 90}
+        self.FEE_HISTORY_BLOCKS = 10
+        self.MIN_PRIORITY_FEE = 10**9
+        self.MAX_FEE_CAP = 50 * 10**9
+        self.PIPELINE_GAS_LIMIT = 500000
+        self.LOCAL_SWAP_SLIPPAGE = 0.01
+        self.GAS_MODEL_MIN_SAMPLES = 5
+        self.GAS_MODEL_WINDOW = 50
+        self.GAS_MODEL_PERCENTILE = 95
+        self.GAS_MODEL_MARGIN = 1.1
+        self.SIGNING_POOL_THRESHOLD = 500
+        self.SIGNING_POOL_BACKLOG = 16
+        self.RPC_POOL_SIZE = 100
+        self.RPC_KEEPALIVE_TIMEOUT = 60
+        self.RPC_HEALTH_TTL = 30
+        self.RPC_BATCH_WINDOW = 0.005
+        self.RPC_MAX_BATCH_SIZE = 50
+        self.RPC_BROADCAST_WINDOW = 0.05
+        self.RPC_BROADCAST_BATCH_SIZE = 100
+        self.RPC_CALL_CACHE_SIZE = 4096
+        self.RPC_QUARANTINE_TIME = 10
+        self.RPC_HEDGE_BUDGET = 0
+        self.RPC_READ_RATE = 200
+        self.RPC_WRITE_RATE = 50
+        self.ROUTE_API_RATE = 5
+        self.ROUTE_BREAKER_WINDOW = 20
+        self.ROUTE_BREAKER_MIN_CALLS = 5
+        self.ROUTE_BREAKER_FAILURE_RATE = 0.5
+        self.ROUTE_BREAKER_COOLDOWN = 60
+        self.PRECHECK_MAX_AGE = 2000
+        self.RECEIPT_TIMEOUT = 300
+        self.STUCK_TX_BLOCKS = 5
+        self.STUCK_TX_FEE_BUMP = 1.125
+        self.STUCK_TX_MAX_BUMPS = 3
+        self.RECEIPT_INT_FIELDS = [
+            "blockNumber",
+            "status",
+            "gasUsed",
+            "cumulativeGasUsed",
+            "effectiveGasPrice",
+            "transactionIndex",
+            "type"
+        ]
+        self.NONCE_ERRORS = [
+            "nonce too low",
+            "replacement transaction underpriced",
+            "invalid nonce"
+        ]
+        self.FUNDS_ERRORS = [
+            "insufficient funds",
+            "insufficient balance"
+        ]
+        self.REVERT_ERRORS = [
+            "execution reverted",
+            "revert",
+            "out of gas"
+        ]
+        self.RATE_LIMIT_ERRORS = [
+            "rate limit",
+            "too many requests"
+        ]
+        self.RETRY_POLICIES = {
+            "network": {"retries": 4, "base": 0.5, "cap": 8},
+            "rate_limited": {"retries": 6, "base": 0.25, "cap": 4},
+            "nonce": {"retries": 2, "base": 0, "cap": 0},
+            "funds": {"retries": 0, "base": 0, "cap": 0},
+            "revert": {"retries": 0, "base": 0, "cap": 0},
+            "permanent": {"retries": 0, "base": 0, "cap": 0}
+        }
         self.TICKERS = [
             "PHRS", 
             "WPHRS", 
@@ -48,30 +525,53 @@ class Faroswap:
             {"type":"function","name":"deposit","stateMutability":"payable","inputs":[],"outputs":[]},
             {"type":"function","name":"withdraw","stateMutability":"nonpayable","inputs":[{"name":"wad","type":"uint256"}],"outputs":[]}
         ]''')
-        self.UNISWAP_V2_CONTRACT_ABI = [
-            {
-                "type": "function",
-                "name": "addDVMLiquidity",
-                "stateMutability": "payable",
-                "inputs": [
-                    { "internalType": "address", "name": "dvmAddress", "type": "address" },
-                    { "internalType": "uint256", "name": "baseInAmount", "type": "uint256" },
-                    { "internalType": "uint256", "name": "quoteInAmount", "type": "uint256" },
-                    { "internalType": "uint256", "name": "baseMinAmount", "type": "uint256" },
-                    { "internalType": "uint256", "name": "quoteMinAmount", "type": "uint256" },
-                    { "internalType": "uint8", "name": "flag", "type": "uint8" },
-                    { "internalType": "uint256", "name": "deadLine", "type": "uint256" }
-                ],
-                "outputs": [
-                    { "internalType": "uint256", "name": "shares", "type": "uint256" },
-                    { "internalType": "uint256", "name": "baseAdjustedInAmount", "type": "uint256" },
-                    { "internalType": "uint256", "name": "quoteAdjustedInAmount", "type": "uint256" }
-                ]
-            }
-        ]
         self.proxies = []
         self.proxy_index = 0
         self.account_proxies = {}
+        self.local_accounts = {}
+        self.account_addresses = {}
+        self.signing_pool = None
+        self.pending_signs = 0
+        self.http_sessions = {}
+        self.http_stats = {"opened": 0, "reused": 0}
+        self.web3_clients = {}
+        self.rpc_limiters = {}
+        self.web3_health = {}
+        self.web3_lock = asyncio.Lock()
+        self.nonce_locks = {}
+        self.local_nonces = {}
+        self.inflight_nonces = {}
+        self.nonce_gaps = {}
+        self.stale_nonces = set()
+        self.tx_nonces = {}
+        self.multicall_available = None
+        self.metadata = {"chain_ids": {}, "decimals": {}}
+        self.checksum_addresses = {}
+        self.contracts = {}
+        self.allowances = {}
+        self.gas_model = {}
+        self.gas_model_reverted = set()
+        self.fee_cache = None
+        self.fee_fetch = None
+        self.route_cache = {}
+        self.route_fetches = {}
+        self.route_cache_stats = {"hits": 0, "misses": 0, "local": 0}
+        self.route_limiter = RateLimiter(self.ROUTE_API_RATE)
+        self.retry_stats = {"retried": {}, "failed_fast": {}}
+        self.route_breaker = {
+            "state": "closed", "outcomes": deque(maxlen=self.ROUTE_BREAKER_WINDOW),
+            "opened_at": 0, "opens": 0, "skipped": 0
+        }
+        self.receipt_waiters = {}
+        self.receipt_deadlines = {}
+        self.receipt_checked = {}
+        self.receipt_web3 = None
+        self.receipt_tracker = None
+        self.pending_txs = {}
+        self.tx_versions = {}
+        self.stuck_tx_stats = {"bumped": 0, "replaced": 0, "cancelled": 0}
+        self.block_time = 2.0
+        self.last_block_seen = None
         self.dp_or_wd_option = None
         self.deposit_amount = 0
         self.withdraw_amount = 0
@@ -91,14 +591,18 @@ class Faroswap:
         self.wbtc_add_lp_amount = 0
         self.min_delay = 0
         self.max_delay = 0
+        self.max_concurrency = 1
+        self.pipeline_mode = False
 
     def clear_terminal(self):
         os.system('cls' if os.name == 'nt' else 'clear')
 
     def log(self, message):
+        account = log_account.get()
         print(
             f"{Fore.CYAN + Style.BRIGHT}[ {datetime.now().astimezone(wib).strftime('%x %X %Z')} ]{Style.RESET_ALL}"
-            f"{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}{message}",
+            f"{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}"
+            f"{Fore.MAGENTA + Style.BRIGHT + '[ ' + account + ' ] ' + Style.RESET_ALL if account else ''}{message}",
             flush=True
         )
 
@@ -133,17 +637,155 @@ class Faroswap:
         except json.JSONDecodeError:
             return []
     
+    def load_metadata(self):
+        filename = "metadata.json"
+        try:
+            if not os.path.exists(filename):
+                return
+
+            with open(filename, 'r') as file:
+                data = json.load(file)
+                if isinstance(data, dict):
+                    self.metadata["chain_ids"].update(data.get("chain_ids", {}))
+                    self.metadata["decimals"].update(data.get("decimals", {}))
+        except json.JSONDecodeError:
+            return
+
+    def save_metadata(self):
+        filename = "metadata.json"
+        try:
+            with open(filename, 'w') as file:
+                json.dump(self.metadata, file, indent=4)
+        except Exception as e:
+            self.log(f"{Fore.RED + Style.BRIGHT}Failed To Save {filename}: {e}{Style.RESET_ALL}")
+
+    def load_gas_model(self):
+        filename = "gas_model.json"
+        try:
+            if not os.path.exists(filename):
+                return
+
+            with open(filename, 'r') as file:
+                data = json.load(file)
+                if isinstance(data, dict):
+                    for key, samples in data.items():
+                        if isinstance(samples, list):
+                            self.gas_model[key] = [int(gas) for gas in samples][-self.GAS_MODEL_WINDOW:]
+        except json.JSONDecodeError:
+            return
+
+    def save_gas_model(self):
+        filename = "gas_model.json"
+        try:
+            with open(filename, 'w') as file:
+                json.dump(self.gas_model, file, indent=4)
+        except Exception as e:
+            self.log(f"{Fore.RED + Style.BRIGHT}Failed To Save {filename}: {e}{Style.RESET_ALL}")
+
+    def gas_model_key(self, contract_address: str, data: str, token_address: str = None):
+        selector = data[2:10] if data.startswith("0x") else data[:8]
+        return f"{contract_address.lower()}:{selector.lower()}:{(token_address or contract_address).lower()}"
+
+    def learned_gas_limit(self, key: str):
+        samples = self.gas_model.get(key, [])
+        if len(samples) < self.GAS_MODEL_MIN_SAMPLES or key in self.gas_model_reverted:
+            return None
+
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, (len(ordered) * self.GAS_MODEL_PERCENTILE) // 100)
+        return int(ordered[index] * self.GAS_MODEL_MARGIN)
+
+    async def get_gas_limit(self, web3, key: str, tx_params: dict):
+        gas_limit = self.learned_gas_limit(key)
+        if gas_limit:
+            return gas_limit
+
+        estimated_gas = await web3.eth.estimate_gas(tx_params)
+        return int(estimated_gas * 1.2)
+
+    def record_gas_used(self, key: str, receipt):
+        if receipt.status != 1:
+            self.gas_model_reverted.add(key)
+            return
+
+        samples = self.gas_model.setdefault(key, [])
+        samples.append(int(receipt.gasUsed))
+        del samples[:-self.GAS_MODEL_WINDOW]
+        self.gas_model_reverted.discard(key)
+
+    def to_checksum(self, address: str):
+        if address not in self.checksum_addresses:
+            self.checksum_addresses[address] = AsyncWeb3.to_checksum_address(address)
+        return self.checksum_addresses[address]
+
+    def get_contract(self, web3, address: str, abi: list):
+        contract_key = (id(web3), address, id(abi))
+        if contract_key not in self.contracts:
+            self.contracts[contract_key] = web3.eth.contract(address=self.to_checksum(address), abi=abi)
+        return self.contracts[contract_key]
+
+    async def get_chain_id(self, web3):
+        if self.RPC_URL not in self.metadata["chain_ids"]:
+            self.metadata["chain_ids"][self.RPC_URL] = await web3.eth.chain_id
+            self.save_metadata()
+        return self.metadata["chain_ids"][self.RPC_URL]
+
+    async def get_token_decimals(self, web3, token: str):
+        if token == self.PHRS_CONTRACT_ADDRESS:
+            return 18
+
+        token = self.to_checksum(token)
+        if token not in self.metadata["decimals"]:
+            decimals = (await self.multicall_read(web3, [("decimals", token)]))[0]
+            if decimals is None:
+                raise Exception(f"Failed to Read Decimals of {token}")
+            self.metadata["decimals"][token] = decimals
+            self.save_metadata()
+        return self.metadata["decimals"][token]
+
+    async def on_http_connection_opened(self, session, trace_config_ctx, params):
+        self.http_stats["opened"] += 1
+
+    async def on_http_connection_reused(self, session, trace_config_ctx, params):
+        self.http_stats["reused"] += 1
+
+    def get_http_session(self, proxy=None):
+        session = self.http_sessions.get(proxy)
+        if session is None or session.closed:
+            trace_config = TraceConfig()
+            trace_config.on_connection_create_end.append(self.on_http_connection_opened)
+            trace_config.on_connection_reuseconn.append(self.on_http_connection_reused)
+
+            connector_kwargs = {
+                "limit": self.HTTP_POOL_SIZE,
+                "ttl_dns_cache": self.HTTP_DNS_CACHE_TTL,
+                "keepalive_timeout": self.HTTP_KEEPALIVE_TIMEOUT
+            }
+            connector = ProxyConnector.from_url(proxy, **connector_kwargs) if proxy else TCPConnector(**connector_kwargs)
+
+            session = ClientSession(connector=connector, timeout=ClientTimeout(total=30), trace_configs=[trace_config])
+            self.http_sessions[proxy] = session
+
+        return session
+
+    async def close_http_sessions(self):
+        for session in self.http_sessions.values():
+            if not session.closed:
+                await session.close()
+
+        self.http_sessions.clear()
+
     async def load_proxies(self, use_proxy_choice: int):
         filename = "proxy.txt"
         try:
             if use_proxy_choice == 1:
-                async with ClientSession(timeout=ClientTimeout(total=30)) as session:
-                    async with session.get("https://api.proxyscrape.com/v4/free-proxy-list/get?request=display_proxies&proxy_format=protocolipport&format=text") as response:
-                        response.raise_for_status()
-                        content = await response.text()
-                        with open(filename, 'w') as f:
-                            f.write(content)
-                        self.proxies = [line.strip() for line in content.splitlines() if line.strip()]
+                session = self.get_http_session()
+                async with session.get("https://api.proxyscrape.com/v4/free-proxy-list/get?request=display_proxies&proxy_format=protocolipport&format=text") as response:
+                    response.raise_for_status()
+                    content = await response.text()
+                    with open(filename, 'w') as f:
+                        f.write(content)
+                    self.proxies = [line.strip() for line in content.splitlines() if line.strip()]
             else:
                 if not os.path.exists(filename):
                     self.log(f"{Fore.RED + Style.BRIGHT}File {filename} Not Found.{Style.RESET_ALL}")
@@ -187,10 +829,59 @@ class Faroswap:
         self.proxy_index = (self.proxy_index + 1) % len(self.proxies)
         return proxy
     
+    def get_local_account(self, account: str):
+        if account not in self.local_accounts:
+            self.local_accounts[account] = Account.from_key(account)
+            self.account_addresses[account] = self.local_accounts[account].address
+        return self.local_accounts[account]
+
+    async def derive_addresses(self, accounts: list):
+        pending = [account for account in accounts if account not in self.account_addresses]
+
+        if len(accounts) >= self.SIGNING_POOL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            if self.signing_pool is None:
+                self.signing_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+            loop = asyncio.get_running_loop()
+            chunksize = max(1, len(pending) // (os.cpu_count() * 4))
+            addresses = await loop.run_in_executor(None, lambda: list(self.signing_pool.map(derive_address, pending, chunksize=chunksize)))
+            for account, address in zip(pending, addresses):
+                if address:
+                    self.account_addresses[account] = address
+        else:
+            for account in pending:
+                try:
+                    self.get_local_account(account)
+                except Exception:
+                    continue
+
+        self.log(
+            f"{Fore.GREEN + Style.BRIGHT}Signing Backend: {Style.RESET_ALL}"
+            f"{Fore.WHITE + Style.BRIGHT}{type(get_backend()).__name__}, "
+            f"{os.cpu_count() if self.signing_pool else 1} Process(es){Style.RESET_ALL}"
+        )
+
+    async def sign_transaction(self, account: str, tx: dict):
+        self.pending_signs += 1
+        try:
+            await asyncio.sleep(0)
+            if self.signing_pool and self.pending_signs > self.SIGNING_POOL_BACKLOG:
+                return await asyncio.get_running_loop().run_in_executor(self.signing_pool, sign_with_key, account, tx)
+            return self.get_local_account(account).sign_transaction(tx).raw_transaction
+        finally:
+            self.pending_signs -= 1
+
+    def close_signing_pool(self):
+        if self.signing_pool:
+            self.signing_pool.shutdown(wait=False, cancel_futures=True)
+            self.signing_pool = None
+
     def generate_address(self, account: str):
         try:
-            account = Account.from_key(account)
-            address = account.address
+            if account in self.account_addresses:
+                return self.account_addresses[account]
+
+            address = self.get_local_account(account).address
             
             return address
         except Exception as e:
@@ -275,86 +966,633 @@ class Faroswap:
             "amount": amount
         }
         
-    async def get_web3_with_check(self, address: str, use_proxy: bool, retries=3, timeout=60):
-        request_kwargs = {"timeout": timeout}
+    def classify_error(self, error: Exception):
+        if isinstance(error, ClientResponseError):
+            if error.status == 429:
+                return "rate_limited"
+            return "network" if error.status >= 500 else "permanent"
+
+        message = str(error).lower()
+        for kind, patterns in [
+            ("nonce", self.NONCE_ERRORS), ("funds", self.FUNDS_ERRORS),
+            ("revert", self.REVERT_ERRORS), ("rate_limited", self.RATE_LIMIT_ERRORS)
+        ]:
+            if any(pattern in message for pattern in patterns):
+                return kind
+
+        if isinstance(error, (asyncio.TimeoutError, ClientError, OSError, json.JSONDecodeError)):
+            return "network"
+        return "permanent"
+
+    def should_retry(self, kind: str, attempts: dict):
+        attempts[kind] = attempts.get(kind, 0) + 1
+        if attempts[kind] > self.RETRY_POLICIES[kind]["retries"]:
+            if not self.RETRY_POLICIES[kind]["retries"]:
+                self.retry_stats["failed_fast"][kind] = self.retry_stats["failed_fast"].get(kind, 0) + 1
+            return False
+
+        self.retry_stats["retried"][kind] = self.retry_stats["retried"].get(kind, 0) + 1
+        return True
+
+    def retry_delay(self, kind: str, attempt: int):
+        policy = self.RETRY_POLICIES[kind]
+        return random.uniform(0, min(policy["cap"], policy["base"] * 2 ** (attempt - 1)))
+
+    async def run_with_retries(self, operation, label=None):
+        attempts = {}
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                kind = self.classify_error(e)
+                if not self.should_retry(kind, attempts):
+                    raise e
 
+                delay = self.retry_delay(kind, attempts[kind])
+                if label:
+                    self.log(
+                        f"{Fore.CYAN+Style.BRIGHT}     Message :{Style.RESET_ALL}"
+                        f"{Fore.RED+Style.BRIGHT} {label} Failed: {str(e)} {Style.RESET_ALL}"
+                        f"{Fore.YELLOW+Style.BRIGHT}({kind} {attempts[kind]}/{self.RETRY_POLICIES[kind]['retries']}, Retry In {delay:.1f}s){Style.RESET_ALL}"
+                    )
+                await asyncio.sleep(delay)
+
+    async def get_web3_client(self, client_key: tuple, proxy=None, timeout=60):
+        async with self.web3_lock:
+            web3 = self.web3_clients.get(client_key)
+            if web3 is None:
+                for endpoint_uri in self.RPC_URLS:
+                    for kind in ["call", "broadcast"]:
+                        if (endpoint_uri, kind) not in self.rpc_limiters:
+                            self.rpc_limiters[(endpoint_uri, kind)] = RateLimiter(
+                                self.RPC_READ_RATE if kind == "call" else self.RPC_WRITE_RATE,
+                                burst=self.RPC_MAX_BATCH_SIZE if kind == "call" else self.RPC_BROADCAST_BATCH_SIZE
+                            )
+
+                web3 = AsyncWeb3(BatchingHTTPProvider(
+                    self.RPC_URLS, 
+                    batch_window=self.RPC_BATCH_WINDOW, 
+                    max_batch_size=self.RPC_MAX_BATCH_SIZE, 
+                    broadcast_window=self.RPC_BROADCAST_WINDOW, 
+                    max_broadcast_size=self.RPC_BROADCAST_BATCH_SIZE, 
+                    call_cache_size=self.RPC_CALL_CACHE_SIZE, 
+                    quarantine_time=self.RPC_QUARANTINE_TIME, 
+                    hedge_budget=self.RPC_HEDGE_BUDGET, 
+                    read_rate=self.RPC_READ_RATE, 
+                    write_rate=self.RPC_WRITE_RATE, 
+                    rate_limiters=self.rpc_limiters, 
+                    request_kwargs={"timeout": ClientTimeout(total=timeout)}
+                ))
+                for endpoint_uri in self.RPC_URLS:
+                    if proxy:
+                        connector = ProxyConnector.from_url(proxy, limit=self.RPC_POOL_SIZE, keepalive_timeout=self.RPC_KEEPALIVE_TIMEOUT)
+                    else:
+                        connector = TCPConnector(limit=self.RPC_POOL_SIZE, keepalive_timeout=self.RPC_KEEPALIVE_TIMEOUT)
+                    await web3.provider.cache_endpoint_session(endpoint_uri, ClientSession(connector=connector, raise_for_status=True))
+                self.web3_clients[client_key] = web3
+
+        return web3
+
+    async def get_web3_with_check(self, address: str, use_proxy: bool, timeout=60):
         proxy = self.get_next_proxy_for_account(address) if use_proxy else None
+        client_key = (tuple(self.RPC_URLS), proxy)
+        web3 = await self.get_web3_client(client_key, proxy, timeout)
 
-        if use_proxy and proxy:
-            request_kwargs["proxies"] = {"http": proxy, "https": proxy}
+        checked_at = self.web3_health.get(client_key)
+        if checked_at and time.time() - checked_at < self.RPC_HEALTH_TTL:
+            return web3
 
-        for attempt in range(retries):
+        try:
+            await self.run_with_retries(web3.eth.get_block_number)
+            self.web3_health[client_key] = time.time()
+            return web3
+        except Exception as e:
+            self.web3_health.pop(client_key, None)
+            raise Exception(f"Failed to Connect to RPC: {str(e)}")
+
+    async def close_web3_clients(self):
+        if self.receipt_tracker and not self.receipt_tracker.done():
+            self.receipt_tracker.cancel()
+
+        for web3 in self.web3_clients.values():
             try:
-                web3 = Web3(Web3.HTTPProvider(self.RPC_URL, request_kwargs=request_kwargs))
-                web3.eth.get_block_number()
-                return web3
-            except Exception as e:
-                if attempt < retries:
-                    await asyncio.sleep(3)
-                    continue
-                raise Exception(f"Failed to Connect to RPC: {str(e)}")
+                await web3.provider.disconnect()
+            except Exception:
+                pass
+
+        self.web3_clients.clear()
+        self.web3_health.clear()
+        self.receipt_web3 = None
+        self.contracts.clear()
         
+    def encode_read(self, read: tuple):
+        kind = read[0]
+        if kind == "native":
+            return self.MULTICALL3_ADDRESS, self.READ_SELECTORS["getEthBalance"] + encode(["address"], [read[1]])
+        elif kind == "balanceOf":
+            return read[2], self.READ_SELECTORS["balanceOf"] + encode(["address"], [read[1]])
+        elif kind == "decimals":
+            return read[1], self.READ_SELECTORS["decimals"]
+        elif kind == "allowance":
+            return read[2], self.READ_SELECTORS["allowance"] + encode(["address", "address"], [read[1], read[3]])
+        elif kind in ["querySellBase", "querySellQuote"]:
+            return read[1], self.READ_SELECTORS[kind] + encode(["address", "uint256"], [read[2], read[3]])
+
+        raise ValueError(f"Unknown Read Type: {kind}")
+
+    async def multicall_aggregate(self, web3, reads: list):
+        calls = [(target, True, data) for target, data in map(self.encode_read, reads)]
+        calldata = self.READ_SELECTORS["aggregate3"] + encode(["(address,bool,bytes)[]"], [calls])
+
+        raw_result = await web3.eth.call({"to": self.to_checksum(self.MULTICALL3_ADDRESS), "data": calldata})
+        if not raw_result:
+            self.multicall_available = False
+            raise Exception("Multicall3 Not Deployed")
+
+        results = [
+            decode(["uint256"], data)[0] if success and len(data) >= 32 else None
+            for success, data in decode(["(bool,bytes)[]"], raw_result)[0]
+        ]
+        self.multicall_available = True
+
+        return results
+
+    async def rpc_batch_read(self, web3, reads: list):
+        batch_requests = []
+        for read in reads:
+            if read[0] == "native":
+                batch_requests.append(("eth_getBalance", [read[1], "latest"]))
+            else:
+                target, data = self.encode_read(read)
+                batch_requests.append(("eth_call", [{"to": target, "data": "0x" + data.hex()}, "latest"]))
+
+        responses = await asyncio.gather(*[
+            web3.provider.make_request(method, params) for method, params in batch_requests
+        ])
+
+        results = []
+        for response in responses:
+            result = response.get("result")
+            results.append(int(result[2:66], 16) if result and result != "0x" else None)
+
+        return results
+
+    async def multicall_read(self, web3, reads: list):
+        results = []
+        for i in range(0, len(reads), self.MULTICALL_BATCH_SIZE):
+            chunk = reads[i:i + self.MULTICALL_BATCH_SIZE]
+
+            if self.MULTICALL3_ADDRESS and self.multicall_available is not False:
+                try:
+                    results.extend(await self.multicall_aggregate(web3, chunk))
+                    continue
+                except Exception:
+                    pass
+
+            results.extend(await self.rpc_batch_read(web3, chunk))
+
+        return results
+
+    async def get_token_balances(self, web3, pairs: list):
+        tokens = list(dict.fromkeys(
+            self.to_checksum(token) for _, token in pairs
+            if token != self.PHRS_CONTRACT_ADDRESS and self.to_checksum(token) not in self.metadata["decimals"]
+        ))
+
+        reads = [("decimals", token) for token in tokens]
+        for owner, token in pairs:
+            if token == self.PHRS_CONTRACT_ADDRESS:
+                reads.append(("native", owner))
+            else:
+                reads.append(("balanceOf", owner, token))
+
+        results = await self.multicall_read(web3, reads)
+
+        decimals = {token: value for token, value in zip(tokens, results[:len(tokens)]) if value is not None}
+        if decimals:
+            self.metadata["decimals"].update(decimals)
+            self.save_metadata()
+
+        balances = {}
+        for (owner, token), balance in zip(pairs, results[len(tokens):]):
+            token_decimals = 18 if token == self.PHRS_CONTRACT_ADDRESS else self.metadata["decimals"].get(self.to_checksum(token))
+            if balance is None or token_decimals is None:
+                balances[(owner, token)] = None
+                continue
+            balances[(owner, token)] = balance / (10 ** token_decimals)
+
+        return balances
+
+    def encode_static_call(self, function: str, *args):
+        calldata = bytearray(self.WRITE_SELECTORS[function])
+        for arg in args:
+            if isinstance(arg, str):
+                calldata += bytes(12) + bytes.fromhex(arg[2:])
+            else:
+                calldata += arg.to_bytes(32, "big")
+        return "0x" + calldata.hex()
+
+    def encode_local_swap(self, from_token: str, to_token: str, amount: int, min_out: int, pool: str, direction: int, deadline: int):
+        calldata = self.WRITE_SELECTORS["dodoSwapV2TokenToToken"] + encode(
+            ["address", "address", "uint256", "uint256", "address[]", "uint256", "bool", "uint256"],
+            [self.to_checksum(from_token), self.to_checksum(to_token), amount, min_out, [pool], direction, False, deadline]
+        )
+        return "0x" + calldata.hex()
+
+    def build_offline_tx(self, address: str, to: str, data: str, value: int, gas: int, chain_id: int, max_fee: int, max_priority_fee: int):
+        return {
+            "type": 2,
+            "from": address,
+            "to": to,
+            "data": data,
+            "value": value,
+            "gas": gas,
+            "maxFeePerGas": max_fee,
+            "maxPriorityFeePerGas": max_priority_fee,
+            "chainId": chain_id
+        }
+
+    def allowance_key(self, owner: str, token: str, spender: str):
+        return (self.to_checksum(owner), self.to_checksum(token), self.to_checksum(spender))
+
+    def record_allowance_spend(self, owner: str, token: str, spender: str, amount: int):
+        key = self.allowance_key(owner, token, spender)
+        if key in self.allowances:
+            self.allowances[key] = max(self.allowances[key] - amount, 0)
+
+    def invalidate_allowance(self, owner: str, token: str, spender: str):
+        self.allowances.pop(self.allowance_key(owner, token, spender), None)
+
+    async def scan_allowances(self, accounts: list, use_proxy: bool):
+        owners = [self.account_addresses[account] for account in accounts if account in self.account_addresses]
+
+        if not owners:
+            return
+
+        tokens = [getattr(self, f"{ticker}_CONTRACT_ADDRESS") for ticker in self.TICKERS if ticker != "PHRS"]
+        spenders = [self.MIXSWAP_ROUTER_ADDRESS, self.POOL_ROUTER_ADDRESS]
+        keys = [self.allowance_key(owner, token, spender) for owner in owners for token in tokens for spender in spenders]
+
+        try:
+            web3 = await self.get_web3_with_check(owners[0], use_proxy)
+            results = await self.multicall_read(web3, [("allowance", owner, token, spender) for owner, token, spender in keys])
+        except Exception as e:
+            self.log(f"{Fore.RED + Style.BRIGHT}Failed To Scan Allowances: {e}{Style.RESET_ALL}")
+            return
+
+        for key, allowance in zip(keys, results):
+            if allowance is not None:
+                self.allowances[key] = allowance
+
     async def get_token_balance(self, address: str, contract_address: str, use_proxy: bool):
+        balances = await self.get_account_balances(address, [contract_address], use_proxy)
+        return balances[0] if balances else None
+
+    async def get_account_balances(self, address: str, contract_addresses: list, use_proxy: bool):
+        max_age = call_max_age.set(self.PRECHECK_MAX_AGE)
         try:
             web3 = await self.get_web3_with_check(address, use_proxy)
 
-            if contract_address == self.PHRS_CONTRACT_ADDRESS:
-                balance = web3.eth.get_balance(address)
-                decimals = 18
-            else:
-                token_contract = web3.eth.contract(address=web3.to_checksum_address(contract_address), abi=self.ERC20_CONTRACT_ABI)
-                balance = token_contract.functions.balanceOf(address).call()
-                decimals = token_contract.functions.decimals().call()
-
-            token_balance = balance / (10 ** decimals)
+            balances = await self.get_token_balances(web3, [(address, token) for token in contract_addresses])
 
-            return token_balance
+            return [balances[(address, token)] for token in contract_addresses]
         except Exception as e:
             self.log(
                 f"{Fore.CYAN+Style.BRIGHT}     Message :{Style.RESET_ALL}"
                 f"{Fore.RED+Style.BRIGHT} {str(e)} {Style.RESET_ALL}"
             )
             return None
+        finally:
+            call_max_age.reset(max_age)
         
-    async def wait_for_receipt_with_retries(self, web3, tx_hash, retries=5):
-        for attempt in range(retries):
-            await asyncio.sleep(5)
+    async def fetch_fee_params(self, web3):
+        percentiles = list(self.FEE_PERCENTILES.values())
+        try:
+            fee_history = await web3.eth.fee_history(self.FEE_HISTORY_BLOCKS, "latest", percentiles)
+
+            next_base_fee = fee_history["baseFeePerGas"][-1]
+            strategy_index = percentiles.index(self.FEE_PERCENTILES[self.FEE_STRATEGY])
+            rewards = sorted(block_rewards[strategy_index] for block_rewards in fee_history.get("reward", []) if block_rewards)
+            priority_fee = max(rewards[len(rewards) // 2] if rewards else 0, self.MIN_PRIORITY_FEE)
+
+            max_fee = min(2 * next_base_fee + priority_fee, self.MAX_FEE_CAP)
+            priority_fee = min(priority_fee, max_fee)
+        except Exception:
+            max_fee = priority_fee = self.MIN_PRIORITY_FEE
+
+        self.fee_cache = {"max_fee": max_fee, "priority_fee": priority_fee, "fetched_at": time.time()}
+        return self.fee_cache
+
+    async def get_fee_params(self, web3):
+        if self.fee_cache and time.time() - self.fee_cache["fetched_at"] < self.block_time:
+            return self.fee_cache["max_fee"], self.fee_cache["priority_fee"]
+
+        if self.fee_fetch is None or self.fee_fetch.done():
+            self.fee_fetch = asyncio.create_task(self.fetch_fee_params(web3))
+
+        fee_params = await asyncio.shield(self.fee_fetch)
+        return fee_params["max_fee"], fee_params["priority_fee"]
+
+    async def sync_nonce_state(self, web3, address: str):
+        pending_nonce = await web3.eth.get_transaction_count(address, "pending")
+        inflight = {nonce for nonce in self.inflight_nonces.get(address, set()) if nonce >= pending_nonce}
+
+        next_nonce = max([pending_nonce] + [nonce + 1 for nonce in inflight])
+        self.local_nonces[address] = next_nonce
+        self.inflight_nonces[address] = inflight
+        self.nonce_gaps[address] = {nonce for nonce in range(pending_nonce, next_nonce) if nonce not in inflight}
+        self.stale_nonces.discard(address)
+
+    async def get_next_nonce(self, web3, address: str):
+        async with self.nonce_locks.setdefault(address, asyncio.Lock()):
+            if address not in self.local_nonces or address in self.stale_nonces:
+                await self.sync_nonce_state(web3, address)
+
+            gaps = self.nonce_gaps[address]
+            if gaps:
+                nonce = min(gaps)
+                gaps.discard(nonce)
+                return nonce
+
+            nonce = self.local_nonces[address]
+            self.local_nonces[address] = nonce + 1
+            return nonce
+
+    async def resync_nonce(self, web3, address: str):
+        async with self.nonce_locks.setdefault(address, asyncio.Lock()):
+            await self.sync_nonce_state(web3, address)
+
+    def release_nonce(self, address: str, nonce: int):
+        gaps = self.nonce_gaps.setdefault(address, set())
+        if nonce == self.local_nonces.get(address, 0) - 1:
+            self.local_nonces[address] = nonce
+            while self.local_nonces[address] - 1 in gaps:
+                self.local_nonces[address] -= 1
+                gaps.discard(self.local_nonces[address])
+        else:
+            gaps.add(nonce)
+
+    def settle_nonce(self, tx_hash: str, dropped=False):
+        if tx_hash not in self.tx_nonces:
+            return
+
+        address, nonce = self.tx_nonces.pop(tx_hash)
+        self.inflight_nonces.get(address, set()).discard(nonce)
+        if dropped:
+            self.stale_nonces.add(address)
+
+    async def send_transaction(self, web3, account: str, address: str, tx: dict, retry=True):
+        attempts = {}
+        delivered = False
+        nonce = await self.get_next_nonce(web3, address)
+        raw_tx = await self.sign_transaction(account, {**tx, "nonce": nonce})
+        tx_hash = web3.to_hex(web3.keccak(raw_tx))
+        while True:
             try:
-                receipt = await asyncio.to_thread(web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300)
-                return receipt
-            except (Exception, TransactionNotFound) as e:
-                if attempt < retries:
+                await web3.eth.send_raw_transaction(raw_tx)
+                return self.track_sent_tx(web3, account, address, tx, nonce, tx_hash)
+            except Exception as e:
+                if "already known" in str(e).lower():
+                    return self.track_sent_tx(web3, account, address, tx, nonce, tx_hash)
+
+                kind = self.classify_error(e)
+                if kind == "nonce" and delivered:
+                    try:
+                        await web3.eth.get_transaction(tx_hash)
+                    except TransactionNotFound:
+                        await self.resync_nonce(web3, address)
+                        raise e
+                    except Exception:
+                        pass
+                    return self.track_sent_tx(web3, account, address, tx, nonce, tx_hash)
+
+                delivered = delivered or (kind == "network" and not web3.provider.never_delivered(e))
+                if retry and kind in ("network", "rate_limited") and self.should_retry(kind, attempts):
+                    await asyncio.sleep(self.retry_delay(kind, attempts[kind]))
                     continue
-                raise Exception("Transaction receipt not found after maximum retries.")
+
+                if delivered:
+                    return self.track_sent_tx(web3, account, address, tx, nonce, tx_hash)
+
+                self.release_nonce(address, nonce)
+                if not retry or not self.should_retry(kind, attempts):
+                    raise e
+
+                await self.resync_nonce(web3, address)
+                nonce = await self.get_next_nonce(web3, address)
+                raw_tx = await self.sign_transaction(account, {**tx, "nonce": nonce})
+                tx_hash = web3.to_hex(web3.keccak(raw_tx))
+
+    def track_sent_tx(self, web3, account: str, address: str, tx: dict, nonce: int, tx_hash: str):
+        self.inflight_nonces.setdefault(address, set()).add(nonce)
+        self.tx_nonces[tx_hash] = (address, nonce)
+        self.pending_txs[tx_hash] = {
+            "web3": web3, "account": account, "tx": {**tx, "nonce": nonce},
+            "sent_block": self.last_block_seen[0] if self.last_block_seen else None, "bumps": 0
+        }
+        self.tx_versions[tx_hash] = [tx_hash]
+
+        return tx_hash
+
+    async def fill_nonce_gaps(self, account: str, address: str, use_proxy: bool):
+        if not self.nonce_gaps.get(address):
+            return
+
+        try:
+            web3 = await self.get_web3_with_check(address, use_proxy)
+            await self.resync_nonce(web3, address)
+
+            for _ in range(len(self.nonce_gaps[address])):
+                max_fee, max_priority_fee = await self.get_fee_params(web3)
+                fill_tx = {
+                    "to": address,
+                    "from": address,
+                    "value": 0,
+                    "gas": 21000,
+                    "maxFeePerGas": max_fee,
+                    "maxPriorityFeePerGas": max_priority_fee,
+                    "chainId": await self.get_chain_id(web3),
+                }
+                tx_hash = await self.send_transaction(web3, account, address, fill_tx, retry=False)
+                await self.wait_for_receipt_with_retries(web3, tx_hash)
+        except Exception as e:
+            self.log(
+                f"{Fore.CYAN+Style.BRIGHT}     Message :{Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT} Fill Nonce Gap Failed: {str(e)} {Style.RESET_ALL}"
+            )
+
+    def format_receipt(self, receipt: dict):
+        return AttributeDict({
+            key: int(value, 16) if key in self.RECEIPT_INT_FIELDS and isinstance(value, str) else value
+            for key, value in receipt.items()
+        })
+
+    def observe_block(self, block_number: int):
+        now = time.time()
+        if self.last_block_seen:
+            last_number, last_time = self.last_block_seen
+            if block_number > last_number:
+                sample = (now - last_time) / (block_number - last_number)
+                self.block_time = self.block_time * 0.8 + sample * 0.2
+
+        if not self.last_block_seen or block_number > self.last_block_seen[0]:
+            self.last_block_seen = (block_number, now)
+
+    def watch_receipt(self, tx_hash: str, timeout: int):
+        future = self.receipt_waiters.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.receipt_waiters[tx_hash] = future
+            self.receipt_deadlines[tx_hash] = time.time() + timeout
+
+        if self.receipt_tracker is None or self.receipt_tracker.done():
+            self.receipt_tracker = asyncio.create_task(self.track_receipts())
+
+        return future
+
+    def resolve_receipt(self, tx_hash: str, receipt=None, error=None):
+        future = self.receipt_waiters.pop(tx_hash, None)
+        self.receipt_deadlines.pop(tx_hash, None)
+        self.receipt_checked.pop(tx_hash, None)
+        self.pending_txs.pop(tx_hash, None)
+        self.tx_versions.pop(tx_hash, None)
+
+        if receipt and receipt.transactionHash != tx_hash:
+            self.stuck_tx_stats["replaced"] += 1
+
+        if future is None or future.done():
+            return
+        if error:
+            future.set_exception(error)
+        else:
+            future.set_result(receipt)
+
+    async def fetch_receipts(self, web3, block_number: int):
+        tx_hashes = [
+            tx_hash for tx_hash in self.receipt_waiters
+            if self.receipt_checked.get(tx_hash, -1) < block_number
+        ]
+
+        lookups = [
+            (tx_hash, version) for tx_hash in tx_hashes
+            for version in self.tx_versions.get(tx_hash, [tx_hash])
+        ]
+
+        responses = await asyncio.gather(*[
+            web3.provider.make_request("eth_getTransactionReceipt", [version]) for _, version in lookups
+        ])
+
+        for (tx_hash, _), response in zip(lookups, responses):
+            self.receipt_checked[tx_hash] = block_number
+            if response.get("result"):
+                self.resolve_receipt(tx_hash, receipt=self.format_receipt(response["result"]))
+
+    async def bump_stuck_tx(self, tx_hash: str, cancel=False):
+        pending = self.pending_txs[tx_hash]
+        web3, tx = pending["web3"], pending["tx"]
+
+        max_fee, max_priority_fee = await self.get_fee_params(web3)
+        bumped_tx = {
+            **tx,
+            "maxFeePerGas": max(int(tx["maxFeePerGas"] * self.STUCK_TX_FEE_BUMP) + 1, int(max_fee)),
+            "maxPriorityFeePerGas": max(int(tx["maxPriorityFeePerGas"] * self.STUCK_TX_FEE_BUMP) + 1, int(max_priority_fee)),
+        }
+        if cancel:
+            bumped_tx.update({"to": tx["from"], "data": "0x", "value": 0, "gas": 21000})
+
+        raw_tx = await self.sign_transaction(pending["account"], bumped_tx)
+        try:
+            await web3.eth.send_raw_transaction(raw_tx)
+        except Exception as e:
+            if "already known" not in str(e).lower():
+                raise e
+        bumped_hash = web3.to_hex(web3.keccak(raw_tx))
+        self.tx_versions.setdefault(tx_hash, [tx_hash]).append(bumped_hash)
+        pending["tx"] = bumped_tx
+        self.stuck_tx_stats["cancelled" if cancel else "bumped"] += 1
+
+        return bumped_hash
+
+    async def bump_stuck_txs(self, block_number: int):
+        stuck = []
+        for tx_hash, pending in self.pending_txs.items():
+            if tx_hash not in self.receipt_waiters:
+                continue
+            if pending["sent_block"] is None:
+                pending["sent_block"] = block_number
+            elif block_number - pending["sent_block"] >= self.STUCK_TX_BLOCKS and pending["bumps"] < self.STUCK_TX_MAX_BUMPS:
+                pending["sent_block"] = block_number
+                pending["bumps"] += 1
+                stuck.append(tx_hash)
+
+        results = await asyncio.gather(*[self.bump_stuck_tx(tx_hash) for tx_hash in stuck], return_exceptions=True)
+        for tx_hash, result in zip(stuck, results):
+            if isinstance(result, Exception) and "nonce too low" not in str(result).lower():
+                self.log(
+                    f"{Fore.CYAN+Style.BRIGHT}     Message :{Style.RESET_ALL}"
+                    f"{Fore.YELLOW+Style.BRIGHT} Fee Bump For {tx_hash} Failed: {str(result)} {Style.RESET_ALL}"
+                )
+
+    async def track_receipts(self):
+        failures = 0
+        while self.receipt_waiters:
+            try:
+                if self.receipt_web3 is None:
+                    proxy = self.get_next_proxy_for_account("receipts")
+                    self.receipt_web3 = await self.get_web3_client((tuple(self.RPC_URLS), proxy, "receipts"), proxy)
+                block_number = await self.receipt_web3.eth.get_block_number()
+                self.observe_block(block_number)
+                for web3 in self.web3_clients.values():
+                    web3.provider.observe_head(block_number)
+                await self.fetch_receipts(self.receipt_web3, block_number)
+                await self.bump_stuck_txs(block_number)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                kind = self.classify_error(e)
+                await asyncio.sleep(self.retry_delay(kind if self.RETRY_POLICIES[kind]["cap"] else "network", failures))
+
+            now = time.time()
+            for tx_hash, deadline in list(self.receipt_deadlines.items()):
+                if now > deadline:
+                    self.resolve_receipt(tx_hash, error=Exception("Transaction receipt not found after maximum retries."))
+
+            await asyncio.sleep(min(max(self.block_time / 2, 0.25), 5))
+
+    async def wait_for_receipt_with_retries(self, web3, tx_hash, timeout=None):
+        try:
+            receipt = await asyncio.shield(self.watch_receipt(tx_hash, timeout or self.RECEIPT_TIMEOUT))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.settle_nonce(tx_hash, dropped=True)
+            raise e
+
+        self.settle_nonce(tx_hash)
+        return receipt
         
     async def perform_deposit(self, account: str, address: str, use_proxy: bool):
         try:
             web3 = await self.get_web3_with_check(address, use_proxy)
 
-            contract_address = web3.to_checksum_address(self.WPHRS_CONTRACT_ADDRESS)
-            token_contract = web3.eth.contract(address=contract_address, abi=self.ERC20_CONTRACT_ABI)
+            contract_address = self.to_checksum(self.WPHRS_CONTRACT_ADDRESS)
 
             amount_to_wei = web3.to_wei(self.deposit_amount, "ether")
-            deposit_data = token_contract.functions.deposit()
-            estimated_gas = deposit_data.estimate_gas({"from": address, "value": amount_to_wei})
-
-            max_priority_fee = web3.to_wei(1, "gwei")
-            max_fee = max_priority_fee
-
-            deposit_tx = deposit_data.build_transaction({
-                "from": address,
-                "value": amount_to_wei,
-                "gas": int(estimated_gas * 1.2),
-                "maxFeePerGas": int(max_fee),
-                "maxPriorityFeePerGas": int(max_priority_fee),
-                "nonce": web3.eth.get_transaction_count(address, "pending"),
-                "chainId": web3.eth.chain_id,
-            })
-
-            signed_tx = web3.eth.account.sign_transaction(deposit_tx, account)
-            raw_tx = web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_hash = web3.to_hex(raw_tx)
+            deposit_data = self.encode_static_call("deposit")
+            gas_key = self.gas_model_key(contract_address, deposit_data)
+            gas_limit = await self.get_gas_limit(web3, gas_key, {"from": address, "to": contract_address, "data": deposit_data, "value": amount_to_wei})
+
+            max_fee, max_priority_fee = await self.get_fee_params(web3)
+
+            deposit_tx = self.build_offline_tx(
+                address, contract_address, deposit_data, amount_to_wei, gas_limit, 
+                await self.get_chain_id(web3), int(max_fee), int(max_priority_fee)
+            )
+
+            tx_hash = await self.send_transaction(web3, account, address, deposit_tx)
             receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            tx_hash = receipt.transactionHash
+            self.record_gas_used(gas_key, receipt)
             block_number = receipt.blockNumber
 
             return tx_hash, block_number
@@ -369,29 +1607,24 @@ class Faroswap:
         try:
             web3 = await self.get_web3_with_check(address, use_proxy)
 
-            contract_address = web3.to_checksum_address(self.WPHRS_CONTRACT_ADDRESS)
-            token_contract = web3.eth.contract(address=contract_address, abi=self.ERC20_CONTRACT_ABI)
+            contract_address = self.to_checksum(self.WPHRS_CONTRACT_ADDRESS)
 
             amount_to_wei = web3.to_wei(self.withdraw_amount, "ether")
-            withdraw_data = token_contract.functions.withdraw(amount_to_wei)
-            estimated_gas = withdraw_data.estimate_gas({"from": address})
-
-            max_priority_fee = web3.to_wei(1, "gwei")
-            max_fee = max_priority_fee
-
-            withdraw_tx = withdraw_data.build_transaction({
-                "from": address,
-                "gas": int(estimated_gas * 1.2),
-                "maxFeePerGas": int(max_fee),
-                "maxPriorityFeePerGas": int(max_priority_fee),
-                "nonce": web3.eth.get_transaction_count(address, "pending"),
-                "chainId": web3.eth.chain_id,
-            })
-
-            signed_tx = web3.eth.account.sign_transaction(withdraw_tx, account)
-            raw_tx = web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_hash = web3.to_hex(raw_tx)
+            withdraw_data = self.encode_static_call("withdraw", amount_to_wei)
+            gas_key = self.gas_model_key(contract_address, withdraw_data)
+            gas_limit = await self.get_gas_limit(web3, gas_key, {"from": address, "to": contract_address, "data": withdraw_data})
+
+            max_fee, max_priority_fee = await self.get_fee_params(web3)
+
+            withdraw_tx = self.build_offline_tx(
+                address, contract_address, withdraw_data, 0, gas_limit, 
+                await self.get_chain_id(web3), int(max_fee), int(max_priority_fee)
+            )
+
+            tx_hash = await self.send_transaction(web3, account, address, withdraw_tx)
             receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            tx_hash = receipt.transactionHash
+            self.record_gas_used(gas_key, receipt)
             block_number = receipt.blockNumber
 
             return tx_hash, block_number
@@ -402,54 +1635,127 @@ class Faroswap:
             )
             return None, None
     
-    async def approving_token(self, account: str, address: str, router_address: str, asset_address: str, amount_to_wei: int, use_proxy: bool):
+    def log_approve(self, tx_hash: str, block_number: int):
+        explorer = f"https://testnet.pharosscan.xyz/tx/{tx_hash}"
+        
+        self.log(
+            f"{Fore.CYAN+Style.BRIGHT}     Approve :{Style.RESET_ALL}"
+            f"{Fore.GREEN+Style.BRIGHT} Success {Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.CYAN+Style.BRIGHT}     Block   :{Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT} {block_number} {Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.CYAN+Style.BRIGHT}     Tx Hash :{Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT} {tx_hash} {Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.CYAN+Style.BRIGHT}     Explorer:{Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT} {explorer} {Style.RESET_ALL}"
+        )
+
+    async def send_pipeline(self, web3, account: str, address: str, pipeline: list):
+        tx_hashes = []
+        send_error = None
+        for step in pipeline:
+            try:
+                tx_hashes.append(await self.send_transaction(web3, account, address, step["tx"]))
+            except Exception as e:
+                if not tx_hashes:
+                    raise e
+                send_error = e
+                break
+
+        waiters = [
+            asyncio.ensure_future(self.wait_for_receipt_with_retries(web3, tx_hash)) for tx_hash in tx_hashes
+        ]
+        cancelled = {}
+        for index, waiter in enumerate(waiters):
+            try:
+                if (await waiter).status == 1:
+                    continue
+            except Exception:
+                pass
+
+            for tx_hash, dependent in zip(tx_hashes[index + 1:], waiters[index + 1:]):
+                if not dependent.done():
+                    try:
+                        cancelled[tx_hash] = await self.bump_stuck_tx(tx_hash, cancel=True)
+                    except Exception:
+                        pass
+            break
+
+        receipts = await asyncio.gather(*waiters, return_exceptions=True)
+
+        results = []
+        failed_step = None
+        for step, tx_hash, receipt in zip(pipeline, tx_hashes, receipts):
+            was_cancelled = not isinstance(receipt, Exception) and receipt.transactionHash == cancelled.get(tx_hash)
+            if "gas_key" in step and not isinstance(receipt, Exception) and not was_cancelled:
+                self.record_gas_used(step["gas_key"], receipt)
+
+            if was_cancelled or isinstance(receipt, Exception) or receipt.status != 1:
+                if "allowance_key" in step:
+                    self.allowances.pop(step["allowance_key"], None)
+                failed_step = failed_step or f"{step['label']} Tx {tx_hash} {'Cancelled' if was_cancelled else 'Failed'}"
+                continue
+
+            if "allowance_key" in step:
+                self.allowances[step["allowance_key"]] = 2**256 - 1
+                self.log_approve(receipt.transactionHash, receipt.blockNumber)
+
+            results.append((receipt.transactionHash, receipt))
+
+        if failed_step:
+            raise Exception(failed_step)
+        if send_error:
+            raise Exception(f"{pipeline[len(tx_hashes)]['label']} Tx Not Sent: {str(send_error)}")
+
+        return results
+
+    async def approving_token(self, account: str, address: str, router_address: str, asset_address: str, amount_to_wei: int, use_proxy: bool, pipeline=None):
         try:
             web3 = await self.get_web3_with_check(address, use_proxy)
             
-            spender = web3.to_checksum_address(router_address)
-            token_contract = web3.eth.contract(address=web3.to_checksum_address(asset_address), abi=self.ERC20_CONTRACT_ABI)
+            spender = self.to_checksum(router_address)
+            token_contract = self.get_contract(web3, asset_address, self.ERC20_CONTRACT_ABI)
 
-            allowance = token_contract.functions.allowance(address, spender).call()
+            key = self.allowance_key(address, asset_address, spender)
+            allowance = self.allowances.get(key, 0)
             if allowance < amount_to_wei:
-                approve_data = token_contract.functions.approve(spender, 2**256 - 1)
-                estimated_gas = approve_data.estimate_gas({"from": address})
+                allowance = await token_contract.functions.allowance(address, spender).call()
+                self.allowances[key] = allowance
 
-                max_priority_fee = web3.to_wei(1, "gwei")
-                max_fee = max_priority_fee
+            if allowance < amount_to_wei:
+                token_address = self.to_checksum(asset_address)
+                approve_data = self.encode_static_call("approve", spender, 2**256 - 1)
+                gas_key = self.gas_model_key(token_address, approve_data)
+                gas_limit = await self.get_gas_limit(web3, gas_key, {"from": address, "to": token_address, "data": approve_data})
 
-                approve_tx = approve_data.build_transaction({
-                    "from": address,
-                    "gas": int(estimated_gas * 1.2),
-                    "maxFeePerGas": int(max_fee),
-                    "maxPriorityFeePerGas": int(max_priority_fee),
-                    "nonce": web3.eth.get_transaction_count(address, "pending"),
-                    "chainId": web3.eth.chain_id,
-                })
-
-                signed_tx = web3.eth.account.sign_transaction(approve_tx, account)
-                raw_tx = web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                tx_hash = web3.to_hex(raw_tx)
+                max_fee, max_priority_fee = await self.get_fee_params(web3)
+
+                approve_tx = self.build_offline_tx(
+                    address, token_address, approve_data, 0, gas_limit, 
+                    await self.get_chain_id(web3), int(max_fee), int(max_priority_fee)
+                )
+
+                if pipeline is not None:
+                    pipeline.append({"tx": approve_tx, "label": "Approve", "allowance_key": key, "gas_key": gas_key})
+                    return True
+
+                tx_hash = await self.send_transaction(web3, account, address, approve_tx)
                 receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+                tx_hash = receipt.transactionHash
+                self.record_gas_used(gas_key, receipt)
                 block_number = receipt.blockNumber
 
-                explorer = f"https://testnet.pharosscan.xyz/tx/{tx_hash}"
-                
-                self.log(
-                    f"{Fore.CYAN+Style.BRIGHT}     Approve :{Style.RESET_ALL}"
-                    f"{Fore.GREEN+Style.BRIGHT} Success {Style.RESET_ALL}"
-                )
-                self.log(
-                    f"{Fore.CYAN+Style.BRIGHT}     Block   :{Style.RESET_ALL}"
-                    f"{Fore.WHITE+Style.BRIGHT} {block_number} {Style.RESET_ALL}"
-                )
-                self.log(
-                    f"{Fore.CYAN+Style.BRIGHT}     Tx Hash :{Style.RESET_ALL}"
-                    f"{Fore.WHITE+Style.BRIGHT} {tx_hash} {Style.RESET_ALL}"
-                )
-                self.log(
-                    f"{Fore.CYAN+Style.BRIGHT}     Explorer:{Style.RESET_ALL}"
-                    f"{Fore.WHITE+Style.BRIGHT} {explorer} {Style.RESET_ALL}"
-                )
+                if receipt.status == 1:
+                    self.allowances[key] = 2**256 - 1
+                else:
+                    self.allowances.pop(key, None)
+
+                self.log_approve(tx_hash, block_number)
                 await self.print_timer()
 
             return True
@@ -459,47 +1765,74 @@ class Faroswap:
     async def perform_swap(self, account: str, address: str, from_token: str, to_token: str, amount: float, use_proxy: bool):
         try:
             web3 = await self.get_web3_with_check(address, use_proxy)
+            pipeline = [] if self.pipeline_mode else None
             
             if from_token != self.PHRS_CONTRACT_ADDRESS:
-                decimals = web3.eth.contract(
-                    address=web3.to_checksum_address(from_token), 
-                    abi=self.ERC20_CONTRACT_ABI
-                ).functions.decimals().call()
-                await self.approving_token(account, address, self.MIXSWAP_ROUTER_ADDRESS, from_token, int(amount * (10 ** decimals)), use_proxy)
+                decimals = await self.get_token_decimals(web3, from_token)
             else:
                 decimals = 18
 
             amount_to_wei = int(amount * (10 ** decimals))
 
-            dodo_route = await self.get_dodo_route(address, from_token, to_token, amount_to_wei, use_proxy)
-            if not dodo_route:
-                return None, None
-
-            value = dodo_route.get("data", {}).get("value")
-            calldata = dodo_route.get("data", {}).get("data")
-            gas_limit = dodo_route.get("data", {}).get("gasLimit", 300000)
-
-            max_priority_fee = web3.to_wei(1, "gwei")
-            max_fee = max_priority_fee
-
-            swap_tx = {
-                "to": self.MIXSWAP_ROUTER_ADDRESS,
-                "from": address,
-                "data": calldata,
-                "value": int(value),
-                "gas": int(gas_limit),
-                "maxFeePerGas": int(max_fee),
-                "maxPriorityFeePerGas": int(max_priority_fee),
-                "nonce": web3.eth.get_transaction_count(address, "pending"),
-                "chainId": web3.eth.chain_id,
-            }
+            local_route = await self.get_local_route(web3, from_token, to_token, amount_to_wei)
+            spender = self.POOL_ROUTER_ADDRESS if local_route else self.MIXSWAP_ROUTER_ADDRESS
 
-            signed_tx = web3.eth.account.sign_transaction(swap_tx, account)
-            raw_tx = web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_hash = web3.to_hex(raw_tx)
-            receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            if from_token != self.PHRS_CONTRACT_ADDRESS:
+                await self.approving_token(account, address, spender, from_token, amount_to_wei, use_proxy, pipeline)
+
+            gas_key = None
+            if local_route:
+                self.route_cache_stats["local"] += 1
+                router_address = self.to_checksum(self.DVM_ROUTER_ADDRESS)
+                value = 0
+                calldata = self.encode_local_swap(
+                    from_token, to_token, amount_to_wei, local_route["min_out"], 
+                    local_route["pool"], local_route["direction"], int(time.time()) + 600
+                )
+
+                gas_key = self.gas_model_key(router_address, calldata, local_route["pool"])
+                if pipeline:
+                    gas_limit = self.learned_gas_limit(gas_key) or self.PIPELINE_GAS_LIMIT
+                else:
+                    gas_limit = await self.get_gas_limit(web3, gas_key, {"from": address, "to": router_address, "data": calldata, "value": 0})
+            else:
+                dodo_route = await self.get_dodo_route(address, from_token, to_token, amount_to_wei, use_proxy, estimate_gas=not pipeline)
+                if not dodo_route:
+                    return None, None
+
+                router_address = self.MIXSWAP_ROUTER_ADDRESS
+                value = dodo_route.get("data", {}).get("value")
+                calldata = dodo_route.get("data", {}).get("data")
+                if pipeline:
+                    gas_key = self.gas_model_key(router_address, calldata, f"{from_token}:{to_token}")
+                    gas_limit = self.learned_gas_limit(gas_key) or self.PIPELINE_GAS_LIMIT
+                else:
+                    gas_limit = dodo_route.get("data", {}).get("gasLimit", 300000)
+
+            max_fee, max_priority_fee = await self.get_fee_params(web3)
+
+            swap_tx = self.build_offline_tx(
+                address, router_address, calldata, int(value), int(gas_limit), 
+                await self.get_chain_id(web3), int(max_fee), int(max_priority_fee)
+            )
+
+            if pipeline:
+                pipeline.append({"tx": swap_tx, "label": "Swap", **({"gas_key": gas_key} if gas_key else {})})
+                tx_hash, receipt = (await self.send_pipeline(web3, account, address, pipeline))[-1]
+            else:
+                tx_hash = await self.send_transaction(web3, account, address, swap_tx)
+                receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+                tx_hash = receipt.transactionHash
+                if gas_key:
+                    self.record_gas_used(gas_key, receipt)
             block_number = receipt.blockNumber
 
+            if from_token != self.PHRS_CONTRACT_ADDRESS:
+                if receipt.status == 1:
+                    self.record_allowance_spend(address, from_token, spender, amount_to_wei)
+                else:
+                    self.invalidate_allowance(address, from_token, spender)
+
             return tx_hash, block_number
         except Exception as e:
             self.log(
@@ -512,42 +1845,51 @@ class Faroswap:
         try:
             web3 = await self.get_web3_with_check(address, use_proxy)
 
-            dvm_address = web3.to_checksum_address(pair_address)
+            dvm_address = self.to_checksum(pair_address)
             in_amount = int(amount * (10 ** 6))
             min_amount = int(in_amount * (1 - 0.1 / 100))
             deadline = int(time.time()) + 600
 
-            await self.approving_token(account, address, self.POOL_ROUTER_ADDRESS, base_token, in_amount, use_proxy)
-            await self.approving_token(account, address, self.POOL_ROUTER_ADDRESS, quote_token, in_amount, use_proxy)
+            pipeline = [] if self.pipeline_mode else None
 
-            token_contract = web3.eth.contract(address=web3.to_checksum_address(self.DVM_ROUTER_ADDRESS), abi=self.UNISWAP_V2_CONTRACT_ABI)
+            await self.approving_token(account, address, self.POOL_ROUTER_ADDRESS, base_token, in_amount, use_proxy, pipeline)
+            await self.approving_token(account, address, self.POOL_ROUTER_ADDRESS, quote_token, in_amount, use_proxy, pipeline)
 
-            add_lp_data = token_contract.functions.addDVMLiquidity(
-                dvm_address, in_amount, in_amount, min_amount, min_amount, 0, deadline
-            )
+            router_address = self.to_checksum(self.DVM_ROUTER_ADDRESS)
 
-            estimated_gas = add_lp_data.estimate_gas({"from": address, "value": 0})
+            add_lp_data = self.encode_static_call(
+                "addDVMLiquidity", dvm_address, in_amount, in_amount, min_amount, min_amount, 0, deadline
+            )
 
-            max_priority_fee = web3.to_wei(1, "gwei")
-            max_fee = max_priority_fee
+            gas_key = self.gas_model_key(router_address, add_lp_data, dvm_address)
+            if pipeline:
+                gas_limit = self.learned_gas_limit(gas_key) or self.PIPELINE_GAS_LIMIT
+            else:
+                gas_limit = await self.get_gas_limit(web3, gas_key, {"from": address, "to": router_address, "data": add_lp_data, "value": 0})
 
-            add_lp_tx = add_lp_data.build_transaction({
-                "from": address,
-                "value": 0,
-                "gas": int(estimated_gas * 1.2),
-                "maxFeePerGas": int(max_fee),
-                "maxPriorityFeePerGas": int(max_priority_fee),
-                "nonce": web3.eth.get_transaction_count(address, "pending"),
-                "chainId": web3.eth.chain_id,
-            })
+            max_fee, max_priority_fee = await self.get_fee_params(web3)
 
-            signed_tx = web3.eth.account.sign_transaction(add_lp_tx, account)
-            raw_tx = web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_hash = web3.to_hex(raw_tx)
+            add_lp_tx = self.build_offline_tx(
+                address, router_address, add_lp_data, 0, gas_limit, 
+                await self.get_chain_id(web3), int(max_fee), int(max_priority_fee)
+            )
 
-            receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            if pipeline:
+                pipeline.append({"tx": add_lp_tx, "label": "Add Liquidity", "gas_key": gas_key})
+                tx_hash, receipt = (await self.send_pipeline(web3, account, address, pipeline))[-1]
+            else:
+                tx_hash = await self.send_transaction(web3, account, address, add_lp_tx)
+                receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+                tx_hash = receipt.transactionHash
+                self.record_gas_used(gas_key, receipt)
             block_number = receipt.blockNumber
 
+            for token in [base_token, quote_token]:
+                if receipt.status == 1:
+                    self.record_allowance_spend(address, token, self.POOL_ROUTER_ADDRESS, in_amount)
+                else:
+                    self.invalidate_allowance(address, token, self.POOL_ROUTER_ADDRESS)
+
             return tx_hash, block_number
 
         except Exception as e:
@@ -558,7 +1900,19 @@ class Faroswap:
             return None, None
         
     async def print_timer(self):
-        for remaining in range(random.randint(self.min_delay, self.max_delay), 0, -1):
+        delay = random.randint(self.min_delay, self.max_delay)
+
+        if self.max_concurrency > 1:
+            if delay > 0:
+                self.log(
+                    f"{Fore.BLUE + Style.BRIGHT}Wait For{Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT} {delay} {Style.RESET_ALL}"
+                    f"{Fore.BLUE + Style.BRIGHT}Seconds For Next Tx...{Style.RESET_ALL}"
+                )
+                await asyncio.sleep(delay)
+            return
+
+        for remaining in range(delay, 0, -1):
             print(
                 f"{Fore.CYAN + Style.BRIGHT}[ {datetime.now().astimezone(wib).strftime('%x %X %Z')} ]{Style.RESET_ALL}"
                 f"{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}"
@@ -758,6 +2112,38 @@ class Faroswap:
             except ValueError:
                 print(f"{Fore.RED + Style.BRIGHT}Invalid input. Enter a number.{Style.RESET_ALL}")
 
+    def print_pipeline_question(self):
+        while True:
+            pipeline = input(f"{Fore.YELLOW + Style.BRIGHT}Send Approve and Swap/Add LP Tx Back-to-Back? [y/n] -> {Style.RESET_ALL}").strip().lower()
+            if pipeline in ["y", "n"]:
+                self.pipeline_mode = pipeline == "y"
+                break
+            else:
+                print(f"{Fore.RED + Style.BRIGHT}Invalid input. Enter 'y' or 'n'.{Style.RESET_ALL}")
+
+    def print_concurrency_question(self):
+        while True:
+            try:
+                max_concurrency = int(input(f"{Fore.YELLOW + Style.BRIGHT}Max Accounts Running Concurrently [1 = One by One] -> {Style.RESET_ALL}").strip())
+                if max_concurrency > 0:
+                    self.max_concurrency = max_concurrency
+                    break
+                else:
+                    print(f"{Fore.RED + Style.BRIGHT}Please enter positive number.{Style.RESET_ALL}")
+            except ValueError:
+                print(f"{Fore.RED + Style.BRIGHT}Invalid input. Enter a number.{Style.RESET_ALL}")
+
+    def print_hedge_question(self):
+        while True:
+            try:
+                hedge_budget = int(input(f"{Fore.YELLOW + Style.BRIGHT}Max % Of RPC Reads Hedged To A Second Endpoint [0 = Off] -> {Style.RESET_ALL}").strip())
+                if 0 <= hedge_budget <= 100:
+                    self.RPC_HEDGE_BUDGET = hedge_budget / 100
+                    break
+                else:
+                    print(f"{Fore.RED + Style.BRIGHT}Please enter a number between 0 and 100.{Style.RESET_ALL}")
+            except ValueError:
+                print(f"{Fore.RED + Style.BRIGHT}Invalid input. Enter a number.{Style.RESET_ALL}")
 
     def print_question(self):
         while True:
@@ -794,16 +2180,19 @@ class Faroswap:
         elif option == 3:
             self.print_swap_question()
             self.print_delay_question()
+            self.print_pipeline_question()
 
         elif option == 4:
             self.print_add_lp_question()
             self.print_delay_question()
+            self.print_pipeline_question()
 
         elif option == 5:
             self.print_dp_or_wd_question()
             self.print_swap_question()
             self.print_add_lp_question()
             self.print_delay_question()
+            self.print_pipeline_question()
 
         while True:
             try:
@@ -825,39 +2214,204 @@ class Faroswap:
             except ValueError:
                 print(f"{Fore.RED + Style.BRIGHT}Invalid input. Enter a number (1, 2 or 3).{Style.RESET_ALL}")
 
+        self.print_concurrency_question()
+        if len(self.RPC_URLS) > 1:
+            self.print_hedge_question()
+
         return option, choose
     
-    async def get_dodo_route(self, address: str, from_token: str, to_token: str, amount: int, use_proxy: bool, retries=5):
-        for attempt in range(retries):
+    def rewrite_dodo_route(self, route: dict, old_address: str, address: str, old_deadline: int, deadline: int):
+        replacements = {
+            encode(["address"], [old_address]).hex(): encode(["address"], [address]).hex(),
+            encode(["uint256"], [old_deadline]).hex(): encode(["uint256"], [deadline]).hex()
+        }
+
+        calldata = route.get("data", {}).get("data", "")
+        selector, body = calldata[:10], calldata[10:].lower()
+        words = [body[i:i + 64] for i in range(0, len(body), 64)]
+        calldata = selector + "".join(replacements.get(word, word) for word in words)
+        if old_address[2:].lower() in calldata.lower():
+            return None
+
+        return {**route, "data": {**route["data"], "data": calldata}}
+
+    def is_route_fresh(self, cached: dict):
+        if time.time() - cached["fetched_at"] > self.ROUTE_CACHE_TTL:
+            return False
+        if self.last_block_seen and cached["block"] is not None:
+            return self.last_block_seen[0] - cached["block"] <= self.ROUTE_CACHE_BLOCKS
+        return True
+
+    async def refresh_dodo_route(self, route_key: tuple, address: str, use_proxy: bool):
+        from_token, to_token, amount, estimate_gas = route_key
+        route, deadline = await self.fetch_dodo_route(address, from_token, to_token, amount, use_proxy, estimate_gas)
+        if not route:
+            self.route_cache.pop(route_key, None)
+            return None
+
+        self.route_cache[route_key] = {
+            "route": route,
+            "address": address,
+            "deadline": deadline,
+            "block": self.last_block_seen[0] if self.last_block_seen else None,
+            "fetched_at": time.time()
+        }
+        return self.route_cache[route_key]
+
+    async def get_dodo_route(self, address: str, from_token: str, to_token: str, amount: int, use_proxy: bool, estimate_gas=True):
+        route_key = (from_token, to_token, amount, estimate_gas)
+
+        cached = self.route_cache.get(route_key)
+        if cached and self.is_route_fresh(cached):
+            self.route_cache_stats["hits"] += 1
+        elif route_key in self.route_fetches:
+            self.route_cache_stats["hits"] += 1
+            cached = await asyncio.shield(self.route_fetches[route_key])
+        else:
+            self.route_cache_stats["misses"] += 1
+            fetch = asyncio.create_task(self.refresh_dodo_route(route_key, address, use_proxy))
+            fetch.add_done_callback(lambda _: self.route_fetches.pop(route_key, None))
+            self.route_fetches[route_key] = fetch
+            cached = await asyncio.shield(fetch)
+
+        if not cached:
+            return None
+
+        if cached["address"].lower() == address.lower():
+            return cached["route"]
+
+        route = self.rewrite_dodo_route(cached["route"], cached["address"], address, cached["deadline"], int(time.time()) + 600)
+        if route:
+            return route
+
+        self.route_cache_stats["misses"] += 1
+        cached = await self.refresh_dodo_route(route_key, address, use_proxy)
+        return cached["route"] if cached else None
+
+    def route_breaker_allows(self):
+        breaker = self.route_breaker
+        if breaker["state"] == "open" and time.time() - breaker["opened_at"] >= self.ROUTE_BREAKER_COOLDOWN:
+            breaker["state"] = "half_open"
+            return True
+        if breaker["state"] == "closed":
+            return True
+
+        breaker["skipped"] += 1
+        return False
+
+    def record_route_outcome(self, success: bool):
+        breaker = self.route_breaker
+        if breaker["state"] == "half_open":
+            breaker["outcomes"].clear()
+            if success:
+                breaker["state"] = "closed"
+                return
+        else:
+            breaker["outcomes"].append(success)
+            outcomes = breaker["outcomes"]
+            if (
+                breaker["state"] != "closed" or len(outcomes) < self.ROUTE_BREAKER_MIN_CALLS
+                or outcomes.count(False) / len(outcomes) < self.ROUTE_BREAKER_FAILURE_RATE
+            ):
+                return
+            outcomes.clear()
+
+        breaker["state"] = "open"
+        breaker["opened_at"] = time.time()
+        breaker["opens"] += 1
+
+    def release_route_probe(self):
+        if self.route_breaker["state"] == "half_open":
+            self.route_breaker["state"] = "open"
+
+    def get_local_pools(self, from_token: str, to_token: str):
+        usdc, usdt = self.USDC_CONTRACT_ADDRESS, self.USDT_CONTRACT_ADDRESS
+        if {from_token, to_token} != {usdc, usdt} or not self.pools:
+            return []
+
+        pools = []
+        for pool_key, base_token in [("USDC_USDT", usdc), ("USDT_USDC", usdt)]:
+            pool_address = self.pools[0].get(pool_key)
+            if pool_address and AsyncWeb3.is_address(pool_address):
+                pools.append((self.to_checksum(pool_address), 0 if from_token == base_token else 1))
+        return pools
+
+    async def get_local_route(self, web3, from_token: str, to_token: str, amount: int):
+        pools = self.get_local_pools(from_token, to_token)
+        if not pools:
+            return None
+
+        reads = [
+            ("querySellBase" if direction == 0 else "querySellQuote", pool_address, self.DVM_ROUTER_ADDRESS, amount)
+            for pool_address, direction in pools
+        ]
+        max_age = call_max_age.set(int(self.block_time * 1000))
+        try:
+            quotes = await self.multicall_read(web3, reads)
+        except Exception:
+            return None
+        finally:
+            call_max_age.reset(max_age)
+
+        quoted = [(quote, pool_address, direction) for quote, (pool_address, direction) in zip(quotes, pools) if quote]
+        if not quoted:
+            return None
+
+        expected, pool_address, direction = max(quoted)
+        return {
+            "pool": pool_address,
+            "direction": direction,
+            "expected": expected,
+            "min_out": int(expected * (1 - self.LOCAL_SWAP_SLIPPAGE))
+        }
+
+    async def fetch_dodo_route(self, address: str, from_token: str, to_token: str, amount: int, use_proxy: bool, estimate_gas=True):
+        async def fetch():
+            if not self.route_breaker_allows():
+                raise ValueError("Route Service Circuit Open, Skipped")
+
             deadline = int(time.time()) + 600
             url = (
                 f"https://api.dodoex.io/route-service/v2/widget/getdodoroute?chainId=688688&deadLine={deadline}"
                 f"&apikey=a37546505892e1a952&slippage=3.225&source=dodoV2AndMixWasm&toTokenAddress={to_token}"
-                f"&fromTokenAddress={from_token}&userAddr={address}&estimateGas=true&fromAmount={amount}"
+                f"&fromTokenAddress={from_token}&userAddr={address}&estimateGas={str(estimate_gas).lower()}&fromAmount={amount}"
             )
             proxy = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector = ProxyConnector.from_url(proxy) if use_proxy else None
             try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=30)) as session:
-                    async with session.get(url=url, headers=self.HEADERS) as response:
-                        response.raise_for_status()
-                        result = await response.json()
-                        if result.get("status") != 200:
-                            err_msg = result.get("data", "Quote Not Available")
-                            raise ValueError(err_msg)
-
-                        return result
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries:
-                    self.log(
-                        f"{Fore.CYAN+Style.BRIGHT}     Message :{Style.RESET_ALL}"
-                        f"{Fore.RED+Style.BRIGHT} Fetch Dodo Route Failed: {str(e)} {Style.RESET_ALL}"
-                        f"{Fore.YELLOW+Style.BRIGHT}({attempt+1}/{retries}){Style.RESET_ALL}"
-                    )
-                    await asyncio.sleep(3)
-                    continue
+                await self.route_limiter.acquire()
+                session = self.get_http_session(proxy)
+                async with session.get(url=url, headers=self.HEADERS) as response:
+                    response.raise_for_status()
+                    result = await response.json()
+            except asyncio.CancelledError:
+                self.release_route_probe()
+                raise
+            except Exception as e:
+                if isinstance(e, ClientResponseError) and e.status == 429:
+                    self.route_limiter.throttle(parse_retry_after(e))
+                if proxy and isinstance(e, (ClientConnectorError, ProxyConnectionError, ProxyError, ProxyTimeoutError)):
+                    self.release_route_probe()
+                else:
+                    self.record_route_outcome(self.classify_error(e) not in ["network", "rate_limited"])
+                raise e
 
-                return None
+            self.record_route_outcome(True)
+
+            if result.get("status") != 200:
+                err_msg = result.get("data", "Quote Not Available")
+                raise ValueError(err_msg)
+
+            self.route_limiter.recover()
+            return result, deadline
+
+        try:
+            return await self.run_with_retries(fetch, "Fetch Dodo Route")
+        except Exception as e:
+            self.log(
+                f"{Fore.CYAN+Style.BRIGHT}     Message :{Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT} Fetch Dodo Route Failed: {str(e)} {Style.RESET_ALL}"
+            )
+            return None, None
     
     async def process_perform_deposit(self, account: str, address: str, use_proxy: bool):
         tx_hash, block_number = await self.perform_deposit(account, address, use_proxy)
@@ -1075,8 +2629,7 @@ class Faroswap:
                 f"{Fore.BLUE+Style.BRIGHT} {lp_option} {Style.RESET_ALL}"
             )
 
-            base_balance = await self.get_token_balance(address, base_token, use_proxy)
-            quote_balance = await self.get_token_balance(address, quote_token, use_proxy)
+            base_balance, quote_balance = await self.get_account_balances(address, [base_token, quote_token], use_proxy) or (None, None)
 
             self.log(f"{Fore.CYAN+Style.BRIGHT}     Balance :{Style.RESET_ALL}")
             self.log(
@@ -1156,7 +2709,41 @@ class Faroswap:
             await self.process_option_3(account, address, use_proxy)
 
             await self.process_option_4(account, address, use_proxy)
-        
+
+        await self.fill_nonce_gaps(account, address, use_proxy)
+
+    async def process_account_worker(self, account: str, option: int, use_proxy: bool, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            address = self.generate_address(account)
+
+            separator = "=" * 25
+            self.log(
+                f"{Fore.CYAN + Style.BRIGHT}{separator}[{Style.RESET_ALL}"
+                f"{Fore.WHITE + Style.BRIGHT} {self.mask_account(address)} {Style.RESET_ALL}"
+                f"{Fore.CYAN + Style.BRIGHT}]{separator}{Style.RESET_ALL}"
+            )
+
+            if not address:
+                self.log(
+                    f"{Fore.CYAN + Style.BRIGHT}Status       :{Style.RESET_ALL}"
+                    f"{Fore.RED + Style.BRIGHT} Invalid Private Key or Library Version Not Supported {Style.RESET_ALL}"
+                )
+                return
+
+            if self.max_concurrency > 1:
+                log_account.set(self.mask_account(address))
+
+            try:
+                await self.process_accounts(account, address, option, use_proxy)
+            except Exception as e:
+                self.log(
+                    f"{Fore.CYAN + Style.BRIGHT}Status       :{Style.RESET_ALL}"
+                    f"{Fore.RED + Style.BRIGHT} Account Failed: {str(e)} {Style.RESET_ALL}"
+                )
+
+            if self.max_concurrency == 1:
+                await asyncio.sleep(3)
+
     async def main(self):
         try:
             with open('accounts.txt', 'r') as file:
@@ -1165,6 +2752,8 @@ class Faroswap:
             option, use_proxy_choice = self.print_question()
 
             self.pools = self.load_pools()
+            self.load_metadata()
+            self.load_gas_model()
 
             while True:
                 use_proxy = False
@@ -1181,28 +2770,73 @@ class Faroswap:
                 if use_proxy:
                     await self.load_proxies(use_proxy_choice)
                 
-                separator = "=" * 25
-                for account in accounts:
-                    if account:
-                        address = self.generate_address(account)
-
-                        self.log(
-                            f"{Fore.CYAN + Style.BRIGHT}{separator}[{Style.RESET_ALL}"
-                            f"{Fore.WHITE + Style.BRIGHT} {self.mask_account(address)} {Style.RESET_ALL}"
-                            f"{Fore.CYAN + Style.BRIGHT}]{separator}{Style.RESET_ALL}"
-                        )
-
-                        if not address:
-                            self.log(
-                                f"{Fore.CYAN + Style.BRIGHT}Status       :{Style.RESET_ALL}"
-                                f"{Fore.RED + Style.BRIGHT} Invalid Private Key or Library Version Not Supported {Style.RESET_ALL}"
-                            )
-                            continue
-
-                        await self.process_accounts(account, address, option, use_proxy)
-                        await asyncio.sleep(3)
+                await self.derive_addresses(accounts)
+
+                cycle_start = time.time()
+                await self.scan_allowances(accounts, use_proxy)
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                await asyncio.gather(*[
+                    self.process_account_worker(account, option, use_proxy, semaphore)
+                    for account in accounts if account
+                ])
+                cycle_time = time.time() - cycle_start
+                self.save_gas_model()
 
                 self.log(f"{Fore.CYAN + Style.BRIGHT}={Style.RESET_ALL}"*72)
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}Cycle Summary  : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{len(accounts)} Accounts in {self.format_seconds(cycle_time)}{Style.RESET_ALL}"
+                    f"{Fore.MAGENTA + Style.BRIGHT} - {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{cycle_time / max(len(accounts), 1):.2f}s/Account, {self.max_concurrency} Concurrent{Style.RESET_ALL}"
+                )
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}Route Cache    : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{self.route_cache_stats['hits']} Hits / {self.route_cache_stats['misses']} Misses / {self.route_cache_stats['local']} Quoted Locally{Style.RESET_ALL}"
+                )
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}HTTP Pool      : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{self.http_stats['opened']} Opened / {self.http_stats['reused']} Reused Connections{Style.RESET_ALL}"
+                )
+                rpc_stats = [web3.provider.batch_stats for web3 in self.web3_clients.values()]
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}RPC Load       : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{sum(stats['calls'] for stats in rpc_stats)} Calls in {sum(stats['requests'] for stats in rpc_stats)} Requests / {sum(stats['coalesced'] for stats in rpc_stats)} Coalesced / {sum(stats['cached'] for stats in rpc_stats)} Cached{Style.RESET_ALL}"
+                )
+                read_latencies = sorted(latency for web3 in self.web3_clients.values() for latency in web3.provider.read_latencies)
+                if read_latencies:
+                    self.log(
+                        f"{Fore.GREEN + Style.BRIGHT}RPC Reads      : {Style.RESET_ALL}"
+                        f"{Fore.WHITE + Style.BRIGHT}p50 {read_latencies[len(read_latencies) // 2] * 1000:.0f}ms / p99 {read_latencies[int(len(read_latencies) * 0.99)] * 1000:.0f}ms"
+                        f" - {sum(stats['hedged'] for stats in rpc_stats)} Hedged / {sum(stats['hedge_wins'] for stats in rpc_stats)} Won By Hedge{Style.RESET_ALL}"
+                    )
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}Route Breaker  : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{self.route_breaker['state'].replace('_', '-').title()} - {self.route_breaker['opens']} Opened / {self.route_breaker['skipped']} Routes Skipped{Style.RESET_ALL}"
+                )
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}Retries        : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{sum(self.retry_stats['retried'].values())} Retried / {sum(self.retry_stats['failed_fast'].values())} Failed Fast"
+                    f" {dict(self.retry_stats['retried'], **{f'{kind} (fast)': count for kind, count in self.retry_stats['failed_fast'].items()})}{Style.RESET_ALL}"
+                )
+                rpc_limiters = list(self.rpc_limiters.values())
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}Rate Limits    : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}RPC {sum(limiter.stats['throttled'] for limiter in rpc_limiters)} Throttled, "
+                    f"Peak Use {max([limiter.utilisation() for limiter in rpc_limiters] or [0]):.0%} / "
+                    f"Route API {self.route_limiter.rate:.1f}/s, {self.route_limiter.stats['throttled']} Throttled{Style.RESET_ALL}"
+                )
+                quarantined = {
+                    uri for web3 in self.web3_clients.values()
+                    for uri, stats in web3.provider.endpoint_stats.items() if stats["quarantined_until"] > time.time()
+                }
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}RPC Endpoints  : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{len(self.RPC_URLS) - len(quarantined)} Healthy / {len(quarantined)} Quarantined{Style.RESET_ALL}"
+                )
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}Stuck Txs      : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{self.stuck_tx_stats['bumped']} Fee Bumps / {self.stuck_tx_stats['replaced']} Landed As Replacement / {self.stuck_tx_stats['cancelled']} Cancelled{Style.RESET_ALL}"
+                )
                 seconds = 24 * 60 * 60
                 while seconds > 0:
                     formatted_time = self.format_seconds(seconds)
@@ -1223,6 +2857,12 @@ class Faroswap:
         except Exception as e:
             self.log(f"{Fore.RED+Style.BRIGHT}Error: {e}{Style.RESET_ALL}")
             raise e
+        finally:
+            if self.gas_model:
+                self.save_gas_model()
+            await self.close_web3_clients()
+            await self.close_http_sessions()
+            self.close_signing_pool()
 
 if __name__ == "__main__":
     try: